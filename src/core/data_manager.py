@@ -1,71 +1,141 @@
-from typing import List, Tuple
+import numpy as np
+
+# Points are stored as int32 degrees * 1e7 (~1 cm resolution)
+E7 = 1e7
+
+
+def _between(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Boolean mask of lo <= values <= hi, combined in place"""
+    mask = values >= lo
+    np.logical_and(mask, values <= hi, out=mask)
+    return mask
 
 
 class DataManager:
     def __init__(self):
-        self.file_registry = {}  # {file_path: {"points": [], "bounds": {}}}
+        # {file_path: {"lat_e7", "lon_e7", "bounds"}}
+        self.file_registry = {}
+
+        # File-level index: one row of (min_lat, max_lat, min_lon, max_lon)
+        # per entry in _index_paths, rebuilt whenever files change
+        self._index_paths = []
+        self._index_bounds = np.empty((0, 4), dtype=np.float64)
 
-    def add_file(self, file_path: str, points: list):
-        """Store points using your legacy format"""
-        if not points:
+        # Last full query result as int32 E7 pairs with its rounded bounds;
+        # boxes inside it are answered from it
+        self._viewport_cache = {"bounds_e7": None, "points_e7": None}
+
+    def add_file(self, file_path: str, points):
+        """Store points as latitude-sorted fixed-point lat/lon arrays"""
+        arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if arr.size == 0:
             raise ValueError("No valid points found")
 
+        # Sorting by latitude lets queries binary-search the latitude band
+        order = np.argsort(arr[:, 0], kind="stable")
+        lat_e7 = np.round(arr[order, 0] * E7).astype(np.int32)
+        lon_e7 = np.round(arr[order, 1] * E7).astype(np.int32)
         self.file_registry[file_path] = {
-            "points": points,
-            "bounds": self._calculate_bounds(points),
+            "lat_e7": lat_e7,
+            "lon_e7": lon_e7,
+            "bounds": self._calculate_bounds(lat_e7, lon_e7),
         }
+        self._rebuild_index()
 
     def remove_file(self, file_path: str) -> None:
         """Completely purge a file's data"""
         if file_path in self.file_registry:
             del self.file_registry[file_path]
+            self._rebuild_index()
+
+    def get_points_in_bounds(self, selection_bounds: dict) -> np.ndarray:
+        """Return an (N, 2) array of lat/lon points within the selection"""
+        # Convert the query once, rounding like add_file so points lying
+        # exactly on an edge stay inside the inclusive bounds
+        lat_lo, lat_hi = selection_bounds["sw"][0], selection_bounds["nw"][0]
+        lon_lo, lon_hi = selection_bounds["nw"][1], selection_bounds["ne"][1]
+        bounds_e7 = (
+            round(lat_lo * E7),
+            round(lat_hi * E7),
+            round(lon_lo * E7),
+            round(lon_hi * E7),
+        )
+        lat_lo_e7, lat_hi_e7, lon_lo_e7, lon_hi_e7 = bounds_e7
 
-    def get_points_in_bounds(
-        self, selection_bounds: dict
-    ) -> List[Tuple[float, float]]:
-        """Return all points from relevant files within current selection"""
+        cached_bounds = self._viewport_cache["bounds_e7"]
+        if cached_bounds is not None and (
+            cached_bounds[0] <= lat_lo_e7
+            and lat_hi_e7 <= cached_bounds[1]
+            and cached_bounds[2] <= lon_lo_e7
+            and lon_hi_e7 <= cached_bounds[3]
+        ):
+            cached = self._viewport_cache["points_e7"]
+            mask = _between(cached[:, 0], lat_lo_e7, lat_hi_e7)
+            mask &= _between(cached[:, 1], lon_lo_e7, lon_hi_e7)
+            return cached[mask] / E7
+
+        points_e7 = self._query_files(*bounds_e7)
+        self._viewport_cache = {"bounds_e7": bounds_e7, "points_e7": points_e7}
+        return points_e7 / E7
+
+    def _query_files(
+        self, lat_lo_e7: int, lat_hi_e7: int, lon_lo_e7: int, lon_hi_e7: int
+    ) -> np.ndarray:
+        """Scan the indexed files for int32 E7 points inside the given box"""
         relevant_points = []
 
-        for file_data in self.file_registry.values():
-            if self._bounds_overlap(file_data["bounds"], selection_bounds):
-                relevant_points.extend(
-                    [
-                        (lat, lon)
-                        for lat, lon in file_data["points"]
-                        if self._point_in_bounds((lat, lon), selection_bounds)
-                    ]
-                )
+        for file_path in self._files_in_bounds(
+            lat_lo_e7 / E7, lat_hi_e7 / E7, lon_lo_e7 / E7, lon_hi_e7 / E7
+        ):
+            file_data = self.file_registry[file_path]
+            lat_e7 = file_data["lat_e7"]
+            start = np.searchsorted(lat_e7, lat_lo_e7, side="left")
+            stop = np.searchsorted(lat_e7, lat_hi_e7, side="right")
 
-        return relevant_points
+            band_lats = lat_e7[start:stop]
+            band_lons = file_data["lon_e7"][start:stop]
+            mask = _between(band_lons, lon_lo_e7, lon_hi_e7)
+            relevant_points.append(
+                np.stack([band_lats[mask], band_lons[mask]], axis=1)
+            )
 
-    def _calculate_bounds(self, points):
-        """Your original bounds calculation"""
-        lats = [p[0] for p in points]
-        lons = [p[1] for p in points]
+        if not relevant_points:
+            return np.empty((0, 2), dtype=np.int32)
+        return np.concatenate(relevant_points)
+
+    def _calculate_bounds(self, lat_e7: np.ndarray, lon_e7: np.ndarray) -> dict:
+        """Bounding box in degrees of a file's points (lat_e7 sorted)"""
         return {
-            "min_lat": min(lats),
-            "max_lat": max(lats),
-            "min_lon": min(lons),
-            "max_lon": max(lons),
+            "min_lat": int(lat_e7[0]) / E7,
+            "max_lat": int(lat_e7[-1]) / E7,
+            "min_lon": int(lon_e7.min()) / E7,
+            "max_lon": int(lon_e7.max()) / E7,
         }
 
-    def _bounds_overlap(
-        self, file_bounds: dict, selection_bounds: dict
-    ) -> bool:
-        """Fast preliminary check using precomputed bounds"""
-        return not (
-            file_bounds["max_lat"] < selection_bounds["sw"][0]
-            or file_bounds["min_lat"] > selection_bounds["nw"][0]
-            or file_bounds["max_lon"] < selection_bounds["nw"][1]
-            or file_bounds["min_lon"] > selection_bounds["ne"][1]
-        )
+    def _rebuild_index(self) -> None:
+        """Refresh the file-level bounds index from the registry"""
+        self._viewport_cache = {"bounds_e7": None, "points_e7": None}
+        self._index_paths = list(self.file_registry)
+        self._index_bounds = np.array(
+            [
+                [b["min_lat"], b["max_lat"], b["min_lon"], b["max_lon"]]
+                for b in (
+                    self.file_registry[path]["bounds"]
+                    for path in self._index_paths
+                )
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
 
-    def _point_in_bounds(self, point: tuple, selection_bounds: dict) -> bool:
-        """Precise point-in-polygon check"""
-        # Implementation depends on your bounds format
-        # Simplified example using rectangular bounds:
-        lat, lon = point
-        return (
-            selection_bounds["sw"][0] <= lat <= selection_bounds["nw"][0]
-            and selection_bounds["nw"][1] <= lon <= selection_bounds["ne"][1]
+    def _files_in_bounds(
+        self, lat_lo: float, lat_hi: float, lon_lo: float, lon_hi: float
+    ) -> list:
+        """Paths of files whose bounds overlap the given box"""
+        b = self._index_bounds
+        hits = (
+            (b[:, 1] >= lat_lo)
+            & (b[:, 0] <= lat_hi)
+            & (b[:, 3] >= lon_lo)
+            & (b[:, 2] <= lon_hi)
         )
+        return [self._index_paths[i] for i in np.flatnonzero(hits)]
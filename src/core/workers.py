@@ -1,9 +1,37 @@
+import numpy as np
+from lxml import etree
 from PySide6.QtCore import QObject, Signal
-from tcxparser import TCXParser
+
+_TCX_NS = "{http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2}"
+
+
+def _parse_tcx_positions(file_path: str) -> np.ndarray:
+    """Stream trackpoint positions from a TCX file into an (N, 2) array"""
+    buf = np.empty((1024, 2), dtype=np.float64)
+    count = 0
+
+    for _, trackpoint in etree.iterparse(
+        file_path, events=("end",), tag=f"{_TCX_NS}Trackpoint"
+    ):
+        lat = trackpoint.find(f"{_TCX_NS}Position/{_TCX_NS}LatitudeDegrees")
+        lon = trackpoint.find(f"{_TCX_NS}Position/{_TCX_NS}LongitudeDegrees")
+        if lat is not None and lon is not None:
+            if count == len(buf):
+                buf = np.resize(buf, (2 * len(buf), 2))
+            buf[count, 0] = float(lat.text)
+            buf[count, 1] = float(lon.text)
+            count += 1
+
+        # Free parsed elements to keep memory flat on large tracks
+        trackpoint.clear(keep_tail=True)
+        while trackpoint.getprevious() is not None:
+            del trackpoint.getparent()[0]
+
+    return buf[:count]
 
 
 class FileWorker(QObject):
-    finished = Signal(str, list)
+    finished = Signal(str, object)  # file_path, (N, 2) lat/lon ndarray
     error = Signal(str, str)
 
     def __init__(self, file_path):
@@ -12,13 +40,15 @@ class FileWorker(QObject):
 
     def process(self):
         try:
-            trackpoints = TCXParser(self.file_path).position_values()
-            points = [
-                (float(pt[0]), float(pt[1]))
-                for pt in trackpoints
-                if pt[0] and pt[1]
-            ]
-            self.finished.emit(self.file_path, points)
+            arr = _parse_tcx_positions(self.file_path)
+
+            # Drop missing or zeroed positions
+            mask = (
+                ~np.isnan(arr).any(axis=1) & (arr[:, 0] != 0) & (arr[:, 1] != 0)
+            )
+            points = arr[mask]
+            if not len(points):
+                raise ValueError("No valid points found")
 
             self.finished.emit(self.file_path, points)
         except Exception as e:
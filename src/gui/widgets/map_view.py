@@ -1,21 +1,26 @@
+import heapq
 import math
-from pathlib import Path
+import time
 from typing import Tuple
 
 import numpy as np
 from PySide6.QtCore import (
+    QByteArray,
     QObject,
     QRectF,
     QRunnable,
+    QStandardPaths,
     Qt,
     QThreadPool,
+    QTimer,
     QUrl,
     Signal,
     Slot,
 )
-from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
 from PySide6.QtNetwork import (
     QNetworkAccessManager,
+    QNetworkDiskCache,
     QNetworkReply,
     QNetworkRequest,
 )
@@ -24,116 +29,139 @@ from PySide6.QtWidgets import QVBoxLayout, QWidget
 from .overlay import TransparentOverlay
 
 
-class FilterWorkerSignals(QObject):
-    """Signals for the filter worker"""
+class TileDecodeSignals(QObject):
+    """Signals for the tile decode worker"""
 
-    finished = Signal(str, QImage)  # key, filtered_image
-    error = Signal(str)  # error message
+    decoded = Signal(str, QImage)  # key, image (null if decoding failed)
 
 
-class TileFilterWorker(QRunnable):
-    """Worker thread for filtering map tiles."""
+class TileDecodeWorker(QRunnable):
+    """Worker thread for decoding downloaded tile images."""
 
-    def __init__(self, image: QImage, tile_key: str):
+    def __init__(self, tile_key: str, data: QByteArray):
         super().__init__()
-        self.image = image.copy()  # Make a copy to ensure thread safety
         self.tile_key = tile_key
-        self.signals = FilterWorkerSignals()
+        self.data = data
+        self.signals = TileDecodeSignals()
         self.setAutoDelete(True)
 
     @Slot()
     def run(self):
-        """Filter the image in the background thread."""
-        try:
-            # Convert image to ARGB32 format if needed
-            if self.image.format() != QImage.Format_ARGB32:
-                self.image = self.image.convertToFormat(QImage.Format_ARGB32)
-
-            width = self.image.width()
-            height = self.image.height()
-
-            # Convert QImage data to numpy array
-            buffer = self.image.constBits()
-            arr = np.frombuffer(buffer, np.uint8).reshape(height, width, 4)
-
-            # Calculate grayscale and inversion in one step
-            gray = 255 - np.dot(arr[:, :, :3], [0.1, 0.7, 0.2])
-
-            # Create output image
-            result = QImage(width, height, QImage.Format_ARGB32)
-            result_buffer = result.bits()
-            result_arr = np.frombuffer(result_buffer, np.uint8).reshape(
-                height, width, 4
+        """Decode the image in the background thread."""
+        image = QImage()
+        image.loadFromData(self.data)
+        if not image.isNull():
+            # Opaque tiles skip alpha entirely; others are premultiplied.
+            # Either converts to a pixmap without another pass
+            image = image.convertToFormat(
+                QImage.Format_ARGB32_Premultiplied
+                if image.hasAlphaChannel()
+                else QImage.Format_RGB32
             )
+        self.signals.decoded.emit(self.tile_key, image)
 
-            # Set channels (BGR for ARGB32)
-            result_arr[:, :, 0] = gray  # Blue
-            result_arr[:, :, 1] = gray  # Green
-            result_arr[:, :, 2] = gray  # Red
-            result_arr[:, :, 3] = arr[:, :, 3]  # Original alpha
 
-            self.signals.finished.emit(self.tile_key, result)
+class TileCache:
+    """In-memory tile cache; persistence is left to QNetworkDiskCache
 
-        except Exception as e:
-            self.signals.error.emit(
-                f"Error filtering tile {self.tile_key}: {str(e)}"
-            )
+    Eviction prefers old, high-zoom tiles far from the view centre, so the
+    low-zoom tiles used as proxies survive bursts of close-up panning.
+    """
 
+    # Eviction score per second idle, per zoom level, and per doubling of
+    # distance (in tiles at the view's zoom) from the view centre
+    AGE_WEIGHT = 1.0
+    ZOOM_WEIGHT = 2.0
+    DISTANCE_WEIGHT = 4.0
 
-class TileCache:
-    def __init__(self, cache_dir="tile_cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.memory_cache = {}  # Memory cache for original tiles
-        self.filtered_cache = {}  # Memory cache for filtered tiles
+    def __init__(self):
+        self.memory_cache = {}
+        self._meta = {}  # key -> [last_access, zoom, x, y]
         self.max_cache_size = 1000  # Maximum number of tiles to keep in memory
+        self._focus = (0, 0.0, 0.0)  # View zoom and centre in tile units
 
     def __contains__(self, key):
-        """Enable 'in' operator for memory cache"""
+        """Enable 'in' operator for memory cache (does not touch recency)"""
         return key in self.memory_cache
 
     def __getitem__(self, key):
-        """Enable dictionary-like access"""
-        return self.memory_cache[key]
+        """Enable dictionary-like access, marking the tile recently used"""
+        image = self.memory_cache[key]
+        self._meta[key][0] = time.monotonic()
+        return image
 
     def __setitem__(self, key, value):
-        """Enable dictionary-like setting with cache size management"""
-        # Implement LRU-style cache eviction if needed
-        if len(self.memory_cache) >= self.max_cache_size:
-            # Remove oldest items from both caches
-            self.memory_cache.pop(next(iter(self.memory_cache)))
-            self.filtered_cache.pop(next(iter(self.filtered_cache)))
-
+        """Enable dictionary-like setting with score-based eviction"""
+        zoom, x, y = map(int, key.split("_"))
         self.memory_cache[key] = value
+        self._meta[key] = [time.monotonic(), zoom, x, y]
+        self._evict()
+
+    def _score(self, meta, now: float) -> float:
+        """Eviction score of a tile; higher is evicted first"""
+        last_access, zoom, x, y = meta
+        focus_zoom, focus_x, focus_y = self._focus
+
+        # Gap between the tile's footprint and the view centre, in tiles at
+        # the view's zoom; ancestors of the view are at distance 0
+        scale = 2.0 ** (focus_zoom - zoom)
+        distance = max(
+            x * scale - focus_x,
+            focus_x - (x + 1) * scale,
+            y * scale - focus_y,
+            focus_y - (y + 1) * scale,
+            0.0,
+        )
+        return (
+            self.AGE_WEIGHT * (now - last_access)
+            + self.ZOOM_WEIGHT * zoom
+            + self.DISTANCE_WEIGHT * math.log2(1.0 + distance)
+        )
 
-    def get_tile_path(self, x: int, y: int, zoom: int) -> Path:
-        """Generate filesystem path for a tile"""
-        return self.cache_dir / f"tile_{zoom}_{x}_{y}.png"
-
-    def get_tile(self, x: int, y: int, zoom: int) -> QImage:
-        """Read tile from disk cache"""
-        path = self.get_tile_path(x, y, zoom)
-        if path.exists():
-            image = QImage()
-            if image.load(str(path)):
-                return image
-        return None
+    def _evict(self):
+        """Drop the worst-scoring tiles until within capacity"""
+        excess = len(self.memory_cache) - self.max_cache_size
+        if excess <= 0:
+            return
 
-    def save_tile(self, x: int, y: int, zoom: int, image: QImage) -> bool:
-        """Save tile to disk cache"""
-        try:
-            return image.save(str(self.get_tile_path(x, y, zoom)))
-        except Exception as e:
-            print(f"Error saving tile to cache: {e}")
-            return False
+        # Evict a little extra so scoring isn't repeated on every insert
+        excess += self.max_cache_size // 16
+        now = time.monotonic()
+        victims = heapq.nlargest(
+            excess, self._meta, key=lambda k: self._score(self._meta[k], now)
+        )
+        for key in victims:
+            del self.memory_cache[key]
+            del self._meta[key]
+
+    def set_capacity(self, max_tiles: int):
+        """Resize the cache, evicting tiles if it shrank"""
+        self.max_cache_size = max_tiles
+        self._evict()
 
-    def clear_memory(self):
-        """Clear only memory caches, preserve disk cache"""
-        self.memory_cache.clear()
-        self.filtered_cache.clear()
+    def set_focus(self, zoom: int, center_x: float, center_y: float):
+        """Set the view zoom and centre (in tile units) used for eviction"""
+        self._focus = (zoom, center_x, center_y)
+
+    def get(self, key):
+        """Return a tile if cached, marking it recently used"""
+        image = self.memory_cache.get(key)
+        if image is not None:
+            self._meta[key][0] = time.monotonic()
+        return image
 
 
 class MapView(QWidget):
+    # Tiles kept in memory per tile visible on screen; covers panning back
+    # and a few zoom levels of history
+    CACHE_VIEWPORT_MULTIPLIER = 8
+    MIN_CACHED_TILES = 256
+    # How many zoom levels up to search for a stand-in while a tile loads
+    PROXY_PARENT_LEVELS = 4
+    # Added to the priority of off-screen prefetches so they always queue
+    # behind visible tiles
+    PREFETCH_PRIORITY_OFFSET = 1e9
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
@@ -141,6 +169,7 @@ class MapView(QWidget):
         self.layout.setSpacing(0)
 
         self.zoom_level = 12
+        self._world_size = 256 * (1 << self.zoom_level)  # Map width in px
         self.pan_x = 0
         self.pan_y = 0
         self.last_mouse_pos = None
@@ -149,17 +178,37 @@ class MapView(QWidget):
 
         # Tiels management
         self.tile_cache = TileCache()
-        self.pending_requests = {}
+        # Wanted tiles wait in a heap of (priority, seq, key, x, y, zoom)
+        # and are sent at most _max_inflight at a time, nearest first
+        self._request_queue = []
+        self._request_seq = 0
+        self._queued = set()
+        self._in_flight = set()
+        self._max_inflight = 6
+        self._decoding = set()  # Downloaded, waiting on a decode worker
+        self.decode_pool = QThreadPool(self)
         self.network_manager = QNetworkAccessManager()
         self.network_manager.finished.connect(self.handle_tile_response)
-        self.tile_url_template = (
-            # "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
-            "https://{s}.basemaps.cartocdn.com/{style}/{z}/{x}/{y}{scale}.png"
+
+        # HTTP-level disk cache; serves raw tile bytes without a PNG
+        # re-encode and revalidates using the CDN's cache headers
+        disk_cache = QNetworkDiskCache(self)
+        disk_cache.setCacheDirectory(
+            QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+            + "/tiles"
         )
+        disk_cache.setMaximumCacheSize(512 * 1024 * 1024)
+        self.network_manager.setCache(disk_cache)
+
+        # CARTO basemap style, the path segment before /{z}/{x}/{y}.png
+        self.tile_style = "rastertiles/voyager"
 
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)
-        self.pending_filters = set()
+        # Caps drag repaints at ~60 Hz; later moves within a frame only
+        # update the pan offset
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.setInterval(16)  # ms
+        self._paint_timer.timeout.connect(self.update)
 
         # Widget setup
         self.setMouseTracking(True)
@@ -169,35 +218,21 @@ class MapView(QWidget):
         self.overlay = TransparentOverlay(self)
         self.current_painter = None
 
-    def get_tile(self, x: int, y: int, zoom: int) -> QImage:
-        """Get a tile from cache or network, with asynchronous filtering"""
+    def get_tile(self, x: int, y: int, zoom: int) -> QPixmap:
+        """Get a tile from cache or network"""
         key = self._cache_key(x, y, zoom)
 
-        # Check filtered cache first
-        if key in self.tile_cache.filtered_cache:
-            return self.tile_cache.filtered_cache[key]
-
-        # Get original tile
-        original_tile = None
-
         # Check memory cache
-        if key in self.tile_cache:
-            original_tile = self.tile_cache[key]
-        else:
-            # Check disk cache
-            original_tile = self.tile_cache.get_tile(x, y, zoom)
-            if original_tile:
-                self.tile_cache[key] = original_tile
-
-        if original_tile:
-            return original_tile
-
-        # Request from network if not found
+        tile = self.tile_cache.get(key)
+        if tile is not None:
+            return tile
+
+        # Request from network (or its disk cache) if not found
         self.request_tile(x, y, zoom)
         return None
 
     def _cache_key(self, x: int, y: int, zoom: int) -> str:
-        """Generate cache key for both original and filtered tiles"""
+        """Generate cache key for a tile"""
         return f"{zoom}_{x}_{y}"
 
     def zoom_to(
@@ -223,9 +258,11 @@ class MapView(QWidget):
         self.pan_x = center_x - new_world_x
         self.pan_y = center_y - new_world_y
         self.zoom_level = new_zoom
+        self._world_size = 256 * (1 << new_zoom)
         self.overlay.raise_()
 
-        self.clear_cache()
+        # Cached tiles and in-flight requests stay valid; tiles from the
+        # old zoom level are drawn as proxies until the new ones arrive
         self.update()
 
     def get_selection_bounds(self):
@@ -234,38 +271,28 @@ class MapView(QWidget):
         if not hole_rect:
             return None
 
-        def screen_to_map(x, y):
-            map_x = x - self.pan_x
-            map_y = y - self.pan_y
-            tile_x = map_x / 256
-            tile_y = map_y / 256
-            n = 2.0**self.zoom_level
-            lon_deg = (tile_x / n * 360.0) - 180.0
-            lat_rad = math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n)))
-            lat_deg = math.degrees(lat_rad)
-            return (lat_deg, lon_deg)
-
-        nw = screen_to_map(hole_rect.left(), hole_rect.top())
-        ne = screen_to_map(hole_rect.right(), hole_rect.top())
-        sw = screen_to_map(hole_rect.left(), hole_rect.bottom())
-        se = screen_to_map(hole_rect.right(), hole_rect.bottom())
+        # Project all four corners (nw, ne, sw, se) in one pass
+        left, right = hole_rect.left(), hole_rect.right()
+        top, bottom = hole_rect.top(), hole_rect.bottom()
+        lats, lons = self.pixel_to_geo_batch(
+            np.array([left, right, left, right]) - self.pan_x,
+            np.array([top, top, bottom, bottom]) - self.pan_y,
+        )
+
+        nw, ne, sw, se = zip(lats.tolist(), lons.tolist())
 
         return {"nw": nw, "ne": ne, "sw": sw, "se": se}
 
-    def _on_filter_completed(self, key: str, filtered_image: QImage):
-        """Handle completed filter operation"""
-        self.tile_cache.filtered_cache[key] = filtered_image
-        self.pending_filters.discard(key)
-        self.update()  # Trigger repaint with new filtered tile
-
     def set_aspect_ratio(self, width, height):
         """Update the overlay's aspect ratio"""
         self.overlay.set_aspect_ratio(width, height)
 
+    @Slot()
     def zoom_in(self):
         """Zoom in one level, centered on viewport"""
         self.zoom_to(self.zoom_level + 1)
 
+    @Slot()
     def zoom_out(self):
         """Zoom out one level, centered on viewport"""
         self.zoom_to(self.zoom_level - 1)
@@ -301,58 +328,136 @@ class MapView(QWidget):
         )
         return x, y
 
+    def geo_to_pixel_batch(
+        self, lats: np.ndarray, lons: np.ndarray, zoom: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert arrays of latitude/longitude to pixel coordinates in one
+        vectorized pass (defaults to the current zoom level)"""
+        world = self._world_size if zoom is None else 256 * (1 << zoom)
+        lat_rad = np.radians(lats)
+        x = (np.asarray(lons) + 180.0) / 360.0 * world
+        y = (
+            (1.0 - np.log(np.tan(lat_rad) + 1.0 / np.cos(lat_rad)) / np.pi)
+            / 2.0
+            * world
+        )
+        return x, y
+
+    def pixel_to_geo_batch(
+        self, xs: np.ndarray, ys: np.ndarray, zoom: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert arrays of world pixel coordinates to latitude/longitude
+        in one vectorized pass (defaults to the current zoom level)"""
+        world = self._world_size if zoom is None else 256 * (1 << zoom)
+        lons = np.asarray(xs) / world * 360.0 - 180.0
+        frac_y = np.asarray(ys) / world
+        lats = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * frac_y))))
+        return lats, lons
+
     def center_on_location(self, lat: float, lon: float):
         """Center the map on given coordinates"""
         pixel_x, pixel_y = self.geo_to_pixel(lat, lon, self.zoom_level)
         self.pan_x = self.width() / 2 - pixel_x
         self.pan_y = self.height() / 2 - pixel_y
-        self.clear_cache()
         self.update()
 
-    def request_tile(self, x: int, y: int, zoom: int):
-        """Request a map tile if not already cached"""
-        print
+    def request_tile(self, x: int, y: int, zoom: int, prefetch: bool = False):
+        """Queue a map tile for download if not already cached"""
         key = self.tile_key(x, y, zoom)
-        if key in self.tile_cache or key in self.pending_requests:
+        if (
+            key in self.tile_cache
+            or key in self._queued
+            or key in self._in_flight
+            or key in self._decoding
+        ):
             return
 
+        # Squared distance from the view centre, in tiles
+        tile_size = 256
+        center_x = (self.width() / 2 - self.pan_x) / tile_size
+        center_y = (self.height() / 2 - self.pan_y) / tile_size
+        priority = (x + 0.5 - center_x) ** 2 + (y + 0.5 - center_y) ** 2
+        if prefetch:
+            priority += self.PREFETCH_PRIORITY_OFFSET
+
+        self._request_seq += 1
+        heapq.heappush(
+            self._request_queue,
+            (priority, self._request_seq, key, x, y, zoom),
+        )
+        self._queued.add(key)
+
+    def _pump_requests(self):
+        """Send queued tile requests while there are free slots"""
+        if not self._request_queue:
+            return
+        # Includes the prefetch ring around the visible tiles
+        start_x, start_y, end_x, end_y = self._visible_tile_range(margin=1)
+
+        while self._request_queue and len(self._in_flight) < self._max_inflight:
+            _, _, key, x, y, zoom = heapq.heappop(self._request_queue)
+            self._queued.discard(key)
+
+            # Drop requests the view has moved away from
+            if (
+                zoom != self.zoom_level
+                or not (start_x <= x <= end_x and start_y <= y <= end_y)
+                or key in self.tile_cache
+            ):
+                continue
+            self._send_request(key, x, y, zoom)
+
+    def _send_request(self, key: str, x: int, y: int, zoom: int):
+        """Issue the network request for a single tile"""
+        # Spread tiles over the CDN's a/b/c hosts to get more connections
+        subdomain = "abc"[(x + y) % 3]
         url = (
-            self.tile_url_template.replace("{s}", str("a"))
-            .replace("{style}", str("rastertiles/voyager"))
-            .replace("{z}", str(zoom))
-            .replace("{x}", str(x))
-            .replace("{y}", str(y))
-            .replace("{scale}", str(""))
+            f"https://{subdomain}.basemaps.cartocdn.com/{self.tile_style}"
+            f"/{zoom}/{x}/{y}.png"
         )
+
+        self._in_flight.add(key)
+        self.network_manager.get(self._make_request(url, key))
+
+    def _make_request(self, url: str, key: str) -> QNetworkRequest:
+        """Build a tile request tagged with its cache key"""
         request = QNetworkRequest(QUrl(url))
         request.setAttribute(QNetworkRequest.User, key)
+        request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        request.setAttribute(
+            QNetworkRequest.CacheLoadControlAttribute,
+            QNetworkRequest.PreferCache,
+        )
         request.setHeader(
             QNetworkRequest.UserAgentHeader,
             "HeatmapApp/1.1 (contact@example.com)",
         )
+        return request
 
-        self.pending_requests[key] = None
-        self.network_manager.get(request)
-
+    @Slot(QNetworkReply)
     def handle_tile_response(self, reply):
         """Handle network response for tile request"""
         key = reply.request().attribute(QNetworkRequest.Attribute.User)
         if reply.error() == QNetworkReply.NoError:
-            image = QImage()
-            image.loadFromData(reply.readAll())
-            if not image.isNull():
-                # Cache in memory
-                self.tile_cache[key] = image
-
-                # Save to disk cache
-                zoom, x, y = map(int, key.split("_"))
-                self.tile_cache.save_tile(x, y, zoom, image)
-
-                self.update()
+            # Decode off the GUI thread; _on_tile_decoded caches the result
+            worker = TileDecodeWorker(key, reply.readAll())
+            worker.signals.decoded.connect(self._on_tile_decoded)
+            self._decoding.add(key)
+            self.decode_pool.start(worker)
 
         reply.deleteLater()
-        if key in self.pending_requests:
-            del self.pending_requests[key]
+        self._in_flight.discard(key)
+        self._pump_requests()
+
+    @Slot(str, QImage)
+    def _on_tile_decoded(self, key, image):
+        """Cache a tile decoded by a worker and repaint"""
+        self._decoding.discard(key)
+        if not image.isNull():
+            # Cache in memory as a pixmap, ready to blit; pixmaps can only
+            # be created on the GUI thread, so this happens here
+            self.tile_cache[key] = QPixmap.fromImage(image)
+            self.update()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -371,7 +476,8 @@ class MapView(QWidget):
             self.pan_x += delta.x()
             self.pan_y += delta.y()
             self.last_mouse_pos = event.position()
-            self.update()
+            if not self._paint_timer.isActive():
+                self._paint_timer.start()
 
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming"""
@@ -386,6 +492,16 @@ class MapView(QWidget):
         super().resizeEvent(event)
         self.overlay.setGeometry(self.rect())
 
+        # Size the tile cache to the viewport (+1 for partial tiles)
+        tiles_x = math.ceil(self.width() / 256) + 1
+        tiles_y = math.ceil(self.height() / 256) + 1
+        self.tile_cache.set_capacity(
+            max(
+                self.MIN_CACHED_TILES,
+                tiles_x * tiles_y * self.CACHE_VIEWPORT_MULTIPLIER,
+            )
+        )
+
     def paintEvent(self, event):
         try:
             painter = QPainter(self)
@@ -395,51 +511,125 @@ class MapView(QWidget):
             painter.fillRect(self.rect(), QColor(240, 240, 240))
 
             tile_size = 256
-            scale = 2**self.zoom_level
+            start_x, start_y, end_x, end_y = self._visible_tile_range()
+            if end_x < start_x or end_y < start_y:
+                return
+
+            # Bias cache eviction towards tiles away from this view
+            self.tile_cache.set_focus(
+                self.zoom_level,
+                (self.width() / 2 - self.pan_x) / tile_size,
+                (self.height() / 2 - self.pan_y) / tile_size,
+            )
 
-            # Calculate visible tile range
-            viewport_left = -self.pan_x
-            viewport_top = -self.pan_y
-            viewport_right = viewport_left + self.width()
-            viewport_bottom = viewport_top + self.height()
+            # Placeholder for every visible tile in one fill; loaded tiles
+            # are drawn over it
+            painter.fillRect(
+                QRectF(
+                    start_x * tile_size + self.pan_x,
+                    start_y * tile_size + self.pan_y,
+                    (end_x - start_x + 1) * tile_size,
+                    (end_y - start_y + 1) * tile_size,
+                ),
+                QColor(200, 200, 200),
+            )
 
-            # Convert to tile coordinates
-            start_x = max(0, int(viewport_left / tile_size))
-            start_y = max(0, int(viewport_top / tile_size))
-            end_x = min(scale - 1, int(viewport_right / tile_size) + 1)
-            end_y = min(scale - 1, int(viewport_bottom / tile_size) + 1)
+            # Tile indices and screen positions for the whole visible grid
+            grid_x, grid_y = np.meshgrid(
+                np.arange(start_x, end_x + 1),
+                np.arange(start_y, end_y + 1),
+                indexing="ij",
+            )
+            grid_x = grid_x.ravel()
+            grid_y = grid_y.ravel()
+            left = grid_x * float(tile_size) + self.pan_x
+            top = grid_y * float(tile_size) + self.pan_y
 
             # Draw visible tiles
-            for x in range(start_x, end_x + 1):
-                for y in range(start_y, end_y + 1):
-                    tile = self.get_tile(x, y, self.zoom_level)
-                    if tile:
-                        dest_rect = QRectF(
-                            x * tile_size + self.pan_x,
-                            y * tile_size + self.pan_y,
-                            tile_size,
-                            tile_size,
-                        )
-                        painter.drawImage(dest_rect, tile)
-                    else:
-                        # placehgolder ofr tile
-                        painter.fillRect(
-                            QRectF(
-                                x * tile_size + self.pan_x,
-                                y * tile_size + self.pan_y,
-                                tile_size,
-                                tile_size,
-                            ),
-                            QColor(200, 200, 200),
-                        )
+            for x, y, dest_x, dest_y in zip(
+                grid_x.tolist(), grid_y.tolist(), left.tolist(), top.tolist()
+            ):
+                tile = self.get_tile(x, y, self.zoom_level)
+                target = QRectF(dest_x, dest_y, tile_size, tile_size)
+                if tile:
+                    painter.drawPixmap(target, tile, tile.rect())
+                else:
+                    self._draw_proxy_tile(painter, x, y, target)
+
+            self._prefetch_ring(start_x, start_y, end_x, end_y)
+
+            # Send whatever this frame queued, nearest tiles first
+            self._pump_requests()
         finally:
             if self.current_painter:
                 self.current_painter.end()
                 self.current_painter = None
 
-    def clear_cache(self):
-        """Clear tile cache and pending requests"""
-        self.pending_filters.clear()
-        self.pending_requests.clear()
-        self.tile_cache.clear_memory()
-        self.update()
+    def _prefetch_ring(self, start_x, start_y, end_x, end_y):
+        """Queue the one-tile ring around the visible range at low priority"""
+        ring_x0, ring_y0, ring_x1, ring_y1 = self._visible_tile_range(margin=1)
+        zoom = self.zoom_level
+        for x in range(ring_x0, ring_x1 + 1):
+            for y in range(ring_y0, ring_y1 + 1):
+                if start_x <= x <= end_x and start_y <= y <= end_y:
+                    continue
+                self.request_tile(x, y, zoom, prefetch=True)
+
+    def _visible_tile_range(self, margin: int = 0):
+        """Inclusive (start_x, start_y, end_x, end_y) of on-screen tiles,
+        grown by margin tiles on each side and clamped to the world"""
+        tile_size = 256
+        scale = self._world_size // tile_size
+
+        # Calculate visible tile range
+        viewport_left = -self.pan_x
+        viewport_top = -self.pan_y
+        viewport_right = viewport_left + self.width()
+        viewport_bottom = viewport_top + self.height()
+
+        # Convert to tile coordinates
+        start_x = max(0, int(viewport_left / tile_size) - margin)
+        start_y = max(0, int(viewport_top / tile_size) - margin)
+        end_x = min(scale - 1, int(viewport_right / tile_size) + 1 + margin)
+        end_y = min(scale - 1, int(viewport_bottom / tile_size) + 1 + margin)
+        return start_x, start_y, end_x, end_y
+
+    def _draw_proxy_tile(self, painter, x: int, y: int, target: QRectF):
+        """Fill a missing tile from cached tiles at neighbouring zooms"""
+        tile_size = 256
+        zoom = self.zoom_level
+
+        # Nearest cached ancestor, cropped to this tile's footprint
+        for levels in range(1, min(zoom, self.PROXY_PARENT_LEVELS) + 1):
+            parent = self.tile_cache.get(
+                self._cache_key(x >> levels, y >> levels, zoom - levels)
+            )
+            if parent is not None:
+                size = tile_size >> levels
+                mask = (1 << levels) - 1
+                source = QRectF(
+                    (x & mask) * size, (y & mask) * size, size, size
+                )
+                painter.drawPixmap(target, parent, source)
+                return
+
+        # Otherwise whichever of the four children are cached
+        if zoom >= 19:
+            return
+        half = tile_size / 2
+        for dx in (0, 1):
+            for dy in (0, 1):
+                child = self.tile_cache.get(
+                    self._cache_key(2 * x + dx, 2 * y + dy, zoom + 1)
+                )
+                if child is not None:
+                    painter.drawPixmap(
+                        QRectF(
+                            target.x() + dx * half,
+                            target.y() + dy * half,
+                            half,
+                            half,
+                        ),
+                        child,
+                        child.rect(),
+                    )
@@ -1,5 +1,12 @@
-from PySide6.QtCore import Property, QEasingCurve, QPropertyAnimation, QRect, Qt
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen
+from PySide6.QtCore import (
+    Property,
+    QEasingCurve,
+    QPropertyAnimation,
+    QRect,
+    Qt,
+    Slot,
+)
+from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QWidget
 
 
@@ -10,6 +17,9 @@ class TransparentOverlay(QWidget):
         self.setAttribute(Qt.WA_NoSystemBackground)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.aspect_ratio = (16, 9)
+        # width / height and its inverse, recomputed only when it changes
+        self._ar_ratio = 16 / 9
+        self._ar_inverse = 9 / 16
 
         self._hole_rect = QRect()
         self._initialized = False
@@ -19,6 +29,7 @@ class TransparentOverlay(QWidget):
         self._animation.setDuration(250)  # ms
         self._animation.setEasingCurve(QEasingCurve.OutCubic)
 
+    @Slot(int)
     def set_zoom_factor(self, value):
         """Set zoom factor (0.1 to 1.0) and update hole size"""
         self._zoom_factor = max(0.1, min(0.9, value / 100.0))
@@ -40,6 +51,8 @@ class TransparentOverlay(QWidget):
             return
 
         self.aspect_ratio = (width, height)
+        self._ar_ratio = width / height
+        self._ar_inverse = height / width
         if self._initialized:
             self.update_hole_size(animate=True)
 
@@ -65,19 +78,12 @@ class TransparentOverlay(QWidget):
         widget_height = self.height()
 
         # Calculate maximum possible hole size while maintaining aspect ratio
-        if (
-            widget_width * self.aspect_ratio[1]
-            <= widget_height * self.aspect_ratio[0]
-        ):
-            max_hole_width = int(widget_width)
-            max_hole_height = int(
-                max_hole_width * self.aspect_ratio[1] / self.aspect_ratio[0]
-            )
+        if widget_width <= widget_height * self._ar_ratio:
+            max_hole_width = widget_width
+            max_hole_height = int(widget_width * self._ar_inverse)
         else:
-            max_hole_height = int(widget_height)
-            max_hole_width = int(
-                max_hole_height * self.aspect_ratio[0] / self.aspect_ratio[1]
-            )
+            max_hole_height = widget_height
+            max_hole_width = int(widget_height * self._ar_ratio)
 
         # Apply zoom factor to get actual hole size
         new_hole_width = int(max_hole_width * self._zoom_factor)
@@ -100,25 +106,39 @@ class TransparentOverlay(QWidget):
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Create a path for the entire widget
-        full_path = QPainterPath()
-        full_path.addRect(self.rect())
-
-        # Create a path for the hole using current animated rect
-        hole_path = QPainterPath()
-        hole_path.addRect(self._hole_rect)
 
-        # Subtract the hole from the full path
-        final_path = full_path.subtracted(hole_path)
-
-        # Draw the semi-transparent overlay
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(0, 0, 0, 128))
-        painter.drawPath(final_path)
-
-        # Draw orange border around the hole
+        # Draw the semi-transparent overlay as four strips around the hole
+        rect = self.rect()
+        hole = self._hole_rect
+        shade = QColor(0, 0, 0, 128)
+        painter.fillRect(
+            QRect(rect.left(), rect.top(), rect.width(), hole.top()), shade
+        )
+        painter.fillRect(
+            QRect(
+                rect.left(),
+                hole.bottom() + 1,
+                rect.width(),
+                rect.bottom() - hole.bottom(),
+            ),
+            shade,
+        )
+        painter.fillRect(
+            QRect(rect.left(), hole.top(), hole.left(), hole.height()), shade
+        )
+        painter.fillRect(
+            QRect(
+                hole.right() + 1,
+                hole.top(),
+                rect.right() - hole.right(),
+                hole.height(),
+            ),
+            shade,
+        )
+
+        # Draw orange border around the hole; the axis-aligned fills above
+        # don't need antialiasing, only the stroked border
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(QPen(QColor(255, 102, 0, 128), 2))
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(self._hole_rect)
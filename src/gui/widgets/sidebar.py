@@ -1,4 +1,7 @@
-from PySide6.QtCore import Qt, Signal
+import logging
+from functools import lru_cache
+
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QFont, QIntValidator
 from PySide6.QtWidgets import (
     QApplication,
@@ -15,25 +18,56 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from utils.ratio_utils import simplified_ratio
+
+logger = logging.getLogger(__name__)
+
+# Installed once on the QApplication; matched via the actionButton property
+BUTTON_STYLESHEET = """
+    QPushButton[actionButton="true"] {
+        padding: 8px;
+    }
+    QPushButton[actionButton="true"]:hover {
+        background-color: #fc8d1c;
+    }
+    QPushButton[actionButton="true"]:pressed {
+        background-color: #e87d0d;
+    }
+"""
+
+_FILTER_OPTIONS = (
+    "light_all,",
+    "dark_all,",
+    "light_nolabels,",
+    "light_only_labels,",
+    "dark_nolabels,",
+    "dark_only_labels,",
+    "rastertiles/voyager,",
+    "rastertiles/voyager_nolabels,",
+    "rastertiles/voyager_only_labels,",
+    "rastertiles/voyager_labels_under",
+)
+
+
+@lru_cache(maxsize=None)
+def _resolution_validator() -> QIntValidator:
+    """Validator shared by every resolution input"""
+    return QIntValidator(1, 100000)
+
+
+@lru_cache(maxsize=None)
+def _title_font() -> QFont:
+    """Bold 24pt title font, built on first use"""
+    font = QFont()
+    font.setPointSize(24)
+    font.setBold(True)
+    return font
+
 
-def style_button(button: QPushButton, height: int = 40, padding: int = 8):
+def style_button(button: QPushButton, height: int = 40):
     """Apply consistent styling to a button"""
     button.setMinimumHeight(height)
-    button.setStyleSheet(
-        f"""
-        QPushButton {{
-            padding: {padding}px;
-        }}
-        QPushButton:hover {{
-            background-color: #fc8d1c;
-        }}
-        QPushButton:pressed {{
-            background-color: #e87d0d;
-        }}
-        QPushButton:disabled {{
-        }}
-    """
-    )
+    button.setProperty("actionButton", True)
 
 
 class SidebarWidget(QWidget):
@@ -45,6 +79,19 @@ class SidebarWidget(QWidget):
         super().__init__(parent)
         self.map_view = map_view
         self.setFixedWidth(300)
+        self._last_ratio = (16, 9)
+        self._last_width, self._last_height = 1920, 1080
+
+        # Coalesce bursts of keystrokes / slider ticks into one update
+        self._res_timer = QTimer(self)
+        self._res_timer.setSingleShot(True)
+        self._res_timer.setInterval(150)  # ms
+        self._res_timer.timeout.connect(self._apply_resolution_changed)
+
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)  # ms
+        self._selection_timer.timeout.connect(self._apply_selection_changed)
 
         # Create main layout
         self.main_layout = QVBoxLayout(self)
@@ -65,10 +112,7 @@ class SidebarWidget(QWidget):
     def _add_title(self):
         """Add title section"""
         title = QLabel("heatmap²")
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_title_font())
         title.setAlignment(Qt.AlignCenter)
         self.main_layout.addWidget(title)
 
@@ -80,8 +124,8 @@ class SidebarWidget(QWidget):
         input_layout = QHBoxLayout()
         self.res_width = QLineEdit("1920")
         self.res_height = QLineEdit("1080")
-        self.res_width.setValidator(QIntValidator(1, 100000))
-        self.res_height.setValidator(QIntValidator(1, 100000))
+        self.res_width.setValidator(_resolution_validator())
+        self.res_height.setValidator(_resolution_validator())
 
         # Connect signals
         self.res_width.textChanged.connect(self._on_resolution_changed)
@@ -148,9 +192,7 @@ class SidebarWidget(QWidget):
         self.selection_slider.setMinimum(10)
         self.selection_slider.setMaximum(90)
         self.selection_slider.setValue(80)
-        self.selection_slider.valueChanged.connect(
-            self.map_view.overlay.set_zoom_factor
-        )
+        self.selection_slider.valueChanged.connect(self._on_selection_changed)
         layout.addWidget(self.selection_slider)
 
         self.main_layout.addLayout(layout)
@@ -165,27 +207,17 @@ class SidebarWidget(QWidget):
         self.file_layout.setAlignment(Qt.AlignTop)
 
         self.add_file_btn = QPushButton("+")
-        style_button(self.add_file_btn, 30, 8)
+        style_button(self.add_file_btn, 30)
         self.file_layout.addWidget(self.add_file_btn)
 
         self.file_scroll.setWidget(self.file_container)
         self.main_layout.addWidget(self.file_scroll, 1)  # 1 = stretch factor
 
     def _add_filter_selector(self):
-        layout1 = QVBoxLayout(self)
+        layout1 = QVBoxLayout()
 
         self.combo_box = QComboBox()
-
-        self.combo_box.addItem("light_all,")
-        self.combo_box.addItem("dark_all,")
-        self.combo_box.addItem("light_nolabels,")
-        self.combo_box.addItem("light_only_labels,")
-        self.combo_box.addItem("dark_nolabels,")
-        self.combo_box.addItem("dark_only_labels,")
-        self.combo_box.addItem("rastertiles/voyager,")
-        self.combo_box.addItem("rastertiles/voyager_nolabels,")
-        self.combo_box.addItem("rastertiles/voyager_only_labels,")
-        self.combo_box.addItem("rastertiles/voyager_labels_under")
+        self.combo_box.addItems(_FILTER_OPTIONS)
 
         self.combo_box.currentIndexChanged.connect(self._on_filter_change)
 
@@ -214,47 +246,72 @@ class SidebarWidget(QWidget):
         style_button(self.generate_button)
         self.main_layout.addWidget(self.generate_button)
 
-    def _on_resolution_changed(self):
+    @Slot(str)
+    def _on_resolution_changed(self, _text):
         """Handle resolution input changes"""
-        try:
-            width = int(self.res_width.text())
-            height = int(self.res_height.text())
-            self.resolution_changed.emit(width, height)
-
-            # Update aspect ratio display
-            gcd = self._calculate_gcd(width, height)
-            if gcd > 0:
-                self.aspect_width.setText(str(width // gcd))
-                self.aspect_height.setText(str(height // gcd))
-
-                # Update map overlay aspect ratio
-                self.map_view.set_aspect_ratio(width // gcd, height // gcd)
-        except ValueError:
-            pass
-
+        self._res_timer.start()  # restart on every keystroke
+
+    @Slot()
+    def _apply_resolution_changed(self):
+        """Apply the settled resolution to the aspect display and overlay"""
+        # The validators only accept 1..100000; anything else is mid-edit
+        if not (
+            self.res_width.hasAcceptableInput()
+            and self.res_height.hasAcceptableInput()
+        ):
+            return
+        locale = self.res_width.validator().locale()
+        width, _ = locale.toInt(self.res_width.text())
+        height, _ = locale.toInt(self.res_height.text())
+        self._last_width, self._last_height = width, height
+        self.resolution_changed.emit(width, height)
+
+        # Update aspect ratio display
+        ratio = simplified_ratio(width, height)
+        if ratio == self._last_ratio:
+            return  # Same simplified ratio, nothing to redraw
+        self._last_ratio = ratio
+
+        # Batch both field updates into a single repaint
+        self.setUpdatesEnabled(False)
+        with QSignalBlocker(self.aspect_width), QSignalBlocker(
+            self.aspect_height
+        ):
+            self.aspect_width.setText(str(ratio[0]))
+            self.aspect_height.setText(str(ratio[1]))
+        self.setUpdatesEnabled(True)
+
+        # Update map overlay aspect ratio
+        self.map_view.set_aspect_ratio(*ratio)
+
+    @Slot(int)
+    def _on_selection_changed(self, _value):
+        """Handle selection slider changes"""
+        self._selection_timer.start()  # restart on every tick
+
+    @Slot()
+    def _apply_selection_changed(self):
+        """Apply the settled selection slider value to the overlay"""
+        self.map_view.overlay.set_zoom_factor(self.selection_slider.value())
+
+    @Slot(int)
     def _on_zoom_changed(self, value):
         """Handle zoom slider changes"""
         if value != self.map_view.zoom_level:
             self.map_view.zoom_to(value)
 
-    def _calculate_gcd(self, a: int, b: int) -> int:
-        """Calculate greatest common divisor"""
-        while b:
-            a, b = b, a % b
-        return a
-
+    @Slot(int)
     def _on_filter_change(self, index):
         self.selected_value = self.combo_box.itemText(index)
-        print(f"Selected value: {self.selected_value}")
+        logger.debug("Selected value: %s", self.selected_value)
 
     def get_resolution(self) -> tuple[int, int]:
-        """Get current resolution values"""
-        try:
-            width = int(self.res_width.text())
-            height = int(self.res_height.text())
-            return width, height
-        except ValueError:
-            return 1920, 1080  # Default resolution
+        """Get the last valid resolution values"""
+        if self._res_timer.isActive():
+            # Apply an edit still waiting on the debounce
+            self._res_timer.stop()
+            self._apply_resolution_changed()
+        return self._last_width, self._last_height
 
     def clear_file_list(self):
         """Clear all files from the list"""
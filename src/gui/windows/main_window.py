@@ -1,26 +1,37 @@
-from PySide6.QtCore import QSize, QThreadPool
+import logging
+
+from PySide6.QtCore import QSize, QThreadPool, Slot
 from PySide6.QtWidgets import QFileDialog, QHBoxLayout, QMainWindow
 
 from core.data_manager import DataManager
 from core.workers import FileWorker
+from utils.ratio_utils import simplified_ratio
 
 from ..widgets.clickable_widget import ClickableWidget
 from ..widgets.file_widget import FileWidget
 from ..widgets.map_view import MapView
 from ..widgets.sidebar import SidebarWidget
 
+logger = logging.getLogger(__name__)
+
+_FILE_FILTER = "TCX Files (*.tcx);;GPX Files (*.gpx);;All Files (*)"
+
 
 class MapWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.thread_pool = QThreadPool.globalInstance()
         self.loading_files = set()
+        self._last_lock_state = None
         self.data_manager = DataManager()  # Initialize DataManager
 
         self.setWindowTitle("heatmap²")
         self.setGeometry(100, 100, 1200, 800)
 
         self.file_list = []
+        self._file_set = set()  # Membership view of file_list
+        self._file_widgets = {}  # file_path -> FileWidget
+        self._file_dialog = None  # Created on first use, then reused
 
         central_widget = ClickableWidget()
         self.setCentralWidget(central_widget)
@@ -41,32 +52,37 @@ class MapWindow(QMainWindow):
 
         central_widget.setFocus()
 
+    @Slot()
     def toggle_maximized(self):
         if self.isMaximized():
             self.showNormal()
         else:
             self.showMaximized()
 
+    @Slot()
     def add_files(self):
         """Handle + button click to add files"""
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Select Files",
-            "",
-            "TCX Files (*.tcx);;GPX Files (*.gpx);;All Files (*)",
-        )
-        for file_path in files:
-            if file_path not in self.file_list:
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "Select Files")
+            self._file_dialog.setNameFilter(_FILE_FILTER)
+            self._file_dialog.setFileMode(QFileDialog.ExistingFiles)
+
+        if not self._file_dialog.exec():
+            return
+        for file_path in self._file_dialog.selectedFiles():
+            if file_path not in self._file_set:
                 self._start_file_processing(file_path=file_path)
 
     def _start_file_processing(self, file_path):
         """Begin async processing for a single file"""
         self.file_list.append(file_path)
+        self._file_set.add(file_path)
         self.loading_files.add(file_path)
 
         # Add loading widget
         file_widget = FileWidget(file_path)
         file_widget.clicked.connect(self.remove_file)
+        self._file_widgets[file_path] = file_widget
         self.sidebar.file_layout.insertWidget(
             self.sidebar.file_layout.count() - 1, file_widget
         )
@@ -79,34 +95,38 @@ class MapWindow(QMainWindow):
         # Start processing
         self.thread_pool.start(worker.process)
 
-        # Update UI state
-        self._update_ui_lock(True)
+        # Lock the UI when the first pending load starts
+        if len(self.loading_files) == 1:
+            self._update_ui_lock(True)
 
+    @Slot(str, object)
     def _on_file_loaded(self, file_path, points):
         """Handle successful file load"""
         self.data_manager.add_file(file_path, points)
         self._finalize_file_load(file_path)
 
+    @Slot(str, str)
     def _on_file_error(self, file_path, error_msg):
         """Handle file load error"""
-        print(f"Error loading {file_path}: {error_msg}")
+        logger.warning("Error loading %s: %s", file_path, error_msg)
         self.file_list.remove(file_path)
+        self._file_set.discard(file_path)
         self._finalize_file_load(file_path, success=False)
 
     def _finalize_file_load(self, file_path, success=True):
         """Common cleanup for both success and error cases"""
         self.loading_files.discard(file_path)
 
-        # Find and update widget
-        for i in range(self.sidebar.file_layout.count()):
-            widget = self.sidebar.file_layout.itemAt(i).widget()
-            if isinstance(widget, FileWidget) and widget.file_path == file_path:
-                if success:
-                    widget.set_loaded()
-                    widget.load_complete.emit(file_path)
-                else:
-                    widget.deleteLater()
-                break
+        # Update widget
+        if success:
+            widget = self._file_widgets.get(file_path)
+            if widget:
+                widget.set_loaded()
+                widget.load_complete.emit(file_path)
+        else:
+            widget = self._file_widgets.pop(file_path, None)
+            if widget:
+                widget.deleteLater()
 
         # Update UI state when all files are processed
         if not self.loading_files:
@@ -114,55 +134,44 @@ class MapWindow(QMainWindow):
 
     def _update_ui_lock(self, loading):
         """Enable/disable UI elements during loading"""
+        if loading == self._last_lock_state:
+            return
+        self._last_lock_state = loading
         self.sidebar.generate_button.setEnabled(not loading)
         self.sidebar.add_file_btn.setEnabled(not loading)
 
+    @Slot(str)
     def remove_file(self, file_path):
         """Remove a file from the list and its widget from the sidebar"""
         if file_path in self.loading_files:
             return
         self.data_manager.remove_file(file_path=file_path)
 
-        if file_path in self.file_list:
+        if file_path in self._file_set:
+            self._file_set.discard(file_path)
             self.file_list.remove(file_path)
             if len(self.file_list) == 0:
                 self.sidebar.generate_button.setEnabled(False)
 
-        for i in range(self.sidebar.file_layout.count()):
-            widget = self.sidebar.file_layout.itemAt(i).widget()
-            if isinstance(widget, FileWidget) and widget.file_path == file_path:
-                widget.deleteLater()
-                break
+        widget = self._file_widgets.pop(file_path, None)
+        if widget:
+            widget.deleteLater()
 
     def calculate_aspect_ratio(
         self, width: int, height: int
     ) -> tuple[int, int]:
         """Calculate the simplified aspect ratio from dimensions."""
-        if width <= 0 or height <= 0:
-            return (16, 9)  # Default aspect ratio
-
-        def gcd(a: int, b: int) -> int:
-            """Calculate greatest common divisor using Euclidean algorithm."""
-            while b:
-                a, b = b, a % b
-            return a
-
-        divisor = gcd(width, height)
-        return (width // divisor, height // divisor)
+        return simplified_ratio(width, height)
 
+    @Slot()
     def generate_heatmap(self):
         """Handle generate button click"""
-        print("here")
         bounds = self.map_view.get_selection_bounds()
         if not bounds:
             return
 
         # Get resolution from sidebar inputs
-        try:
-            width = int(self.sidebar.res_width.text())
-            height = int(self.sidebar.res_height.text())
-        except ValueError:
-            width, height = 1920, 1080  # Default if invalid
+        width, height = self.sidebar.get_resolution()
 
         # Get selected files
         selected_files = self.file_list
@@ -174,9 +183,9 @@ class MapWindow(QMainWindow):
         # - bounds (coordinate boundaries)
         # - width, height (output resolution)
         # - selected_files (list of TCX/GPX files to process)
-        print(f"Generating heatmap with bounds: {bounds}")
-        print(f"Resolution: {width}x{height}")
-        print(f"Files: {selected_files}")
+        logger.debug("Generating heatmap with bounds: %s", bounds)
+        logger.debug("Resolution: %dx%d", width, height)
+        logger.debug("Files: %s", selected_files)
 
     def sizeHint(self) -> QSize:
         """Provide a reasonable default size"""
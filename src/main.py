@@ -2,12 +2,15 @@ import sys
 
 from PySide6.QtWidgets import QApplication
 
+from gui.widgets.sidebar import BUTTON_STYLESHEET
 from gui.windows.main_window import MapWindow
 from utils.icon_utils import png_to_icon
 
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName("heatmap")  # Names the per-user cache directory
+    app.setStyleSheet(BUTTON_STYLESHEET)
 
     window = MapWindow()
     window.setWindowIcon(png_to_icon())
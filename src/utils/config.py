@@ -1,7 +1,7 @@
-import os
+from pathlib import Path
 
 # Base directory of the project
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Path to the icon file
-ICON_PATH = os.path.join(BASE_DIR, "gui", "resources", "icon.png")
+ICON_PATH = BASE_DIR / "gui" / "resources" / "icon.png"
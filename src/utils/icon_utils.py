@@ -1,11 +1,15 @@
+from functools import lru_cache
+from pathlib import Path
+
 from PySide6 import QtGui
 
 from utils.config import ICON_PATH
 
 
+@lru_cache(maxsize=8)
 def png_to_icon(png_path=None):
     """
-    Convert a PNG image to a QIcon.
+    Convert a PNG image to a QIcon. Results are cached per path.
 
     Args:
         png_path (str, optional): The path to the PNG file. If not provided,
@@ -20,8 +24,12 @@ def png_to_icon(png_path=None):
     if png_path is None:
         png_path = ICON_PATH  # Use the default path from config.py
 
+    png_path = Path(png_path)
+    if not png_path.is_file():
+        raise FileNotFoundError(f"Icon file not found: {png_path}")
+
     icon = QtGui.QIcon()
     icon.addPixmap(
-        QtGui.QPixmap(png_path), QtGui.QIcon.Selected, QtGui.QIcon.On
+        QtGui.QPixmap(str(png_path)), QtGui.QIcon.Selected, QtGui.QIcon.On
     )
     return icon
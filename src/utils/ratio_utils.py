@@ -0,0 +1,11 @@
+from functools import lru_cache
+from math import gcd
+
+
+@lru_cache(maxsize=256)
+def simplified_ratio(width: int, height: int) -> tuple[int, int]:
+    """Reduce width:height to lowest terms, defaulting to 16:9"""
+    if width <= 0 or height <= 0:
+        return (16, 9)  # Default aspect ratio
+    divisor = gcd(width, height)
+    return (width // divisor, height // divisor)